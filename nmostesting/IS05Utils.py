@@ -28,8 +28,8 @@ SCHEDULED_RELATIVE_ACTIVATION = 'activate_scheduled_relative'
 
 
 class IS05Utils(NMOSUtils):
-    def __init__(self, url):
-        NMOSUtils.__init__(self, url)
+    def __init__(self, url, session=None):
+        NMOSUtils.__init__(self, url, session)
 
     def get_valid_transports(self, api_version):
         """Identify the valid transport types for a given version of IS-05"""
@@ -572,7 +572,7 @@ class IS05Utils(NMOSUtils):
     def get_senders(self):
         """Gets a list of the available senders on the API"""
         toReturn = []
-        valid, r = TestHelper.do_request("GET", self.url + "single/senders/")
+        valid, r = TestHelper.do_request("GET", self.url + "single/senders/", session=self.session)
         if valid and r.status_code == 200:
             try:
                 for value in r.json():
@@ -584,7 +584,7 @@ class IS05Utils(NMOSUtils):
     def get_receivers(self):
         """Gets a list of the available receivers on the API"""
         toReturn = []
-        valid, r = TestHelper.do_request("GET", self.url + "single/receivers/")
+        valid, r = TestHelper.do_request("GET", self.url + "single/receivers/", session=self.session)
         if valid and r.status_code == 200:
             try:
                 for value in r.json():
@@ -596,7 +596,8 @@ class IS05Utils(NMOSUtils):
     def get_transporttype(self, port, portType):
         """Get the transport type for a given Sender or Receiver"""
         toReturn = None
-        valid, r = TestHelper.do_request("GET", self.url + "single/" + portType + "s/" + port + "/transporttype")
+        url = self.url + "single/" + portType + "s/" + port + "/transporttype"
+        valid, r = TestHelper.do_request("GET", url, session=self.session)
         if valid and r.status_code == 200:
             try:
                 toReturn = r.json()
@@ -607,7 +608,8 @@ class IS05Utils(NMOSUtils):
     def get_transportfile(self, port):
         """Get the transport file for a given Sender"""
         toReturn = None
-        valid, r = TestHelper.do_request("GET", self.url + "single/senders/" + port + "/transportfile")
+        url = self.url + "single/senders/" + port + "/transportfile"
+        valid, r = TestHelper.do_request("GET", url, session=self.session)
         if valid and r.status_code == 200:
             toReturn = r.text
         return toReturn
@@ -615,7 +617,7 @@ class IS05Utils(NMOSUtils):
     def get_num_paths(self, port, portType):
         """Returns the number or redundant paths on a port"""
         url = self.url + "single/" + portType + "s/" + port + "/constraints/"
-        valid, r = TestHelper.do_request("GET", url)
+        valid, r = TestHelper.do_request("GET", url, session=self.session)
         if valid:
             try:
                 rjson = r.json()
@@ -678,7 +680,7 @@ class IS05Utils(NMOSUtils):
 
     def checkCleanRequest(self, method, dest, data=None, codes=[200]):
         """Checks a request can be made"""
-        status, response = TestHelper.do_request(method, self.url + dest, json=data)
+        status, response = TestHelper.do_request(method, self.url + dest, json=data, session=self.session)
         if not status:
             return status, response
 
@@ -14,6 +14,7 @@
 
 import time
 import functools
+import operator
 import random
 from urllib.parse import urlparse
 from requests.compat import json
@@ -60,6 +61,10 @@ UTC_LEAP = [
     (63072000, 63072009),  # 1 Jan 1972, 10 leap seconds
 ]
 
+# Parts of two URLs to a given API which must match exactly, and the ports implied when none is given
+URL_EXACT_MATCH = operator.attrgetter("scheme", "path")
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
 DEFAULT_ARGS = {
     "list_suites": False,
     "describe_suites": False,
@@ -75,13 +80,21 @@ DEFAULT_ARGS = {
 }
 
 
+@functools.lru_cache(maxsize=64)
+def parse_url(url):
+    """Parse a URL, ignoring any trailing slash. The results are cached since the same URLs are compared repeatedly"""
+    return urlparse(url.rstrip("/"))
+
+
 class NMOSUtils(object):
 
     # Seedable instance of random for deterministic testing
     RANDOM = random.Random()
 
-    def __init__(self, url):
+    def __init__(self, url, session=None):
         self.url = url
+        # Optional requests.Session through which requests are made, to re-use its pooled connections
+        self.session = session
 
     @staticmethod
     def from_UTC(secs, nanos, is_leap=False):
@@ -146,29 +159,19 @@ class NMOSUtils(object):
     def compare_urls(url1, url2):
         """Check that two URLs to a given API are sufficiently similar"""
 
-        url1_parsed = urlparse(url1.rstrip("/"))
-        url2_parsed = urlparse(url2.rstrip("/"))
+        url1_parsed = parse_url(url1)
+        url2_parsed = parse_url(url2)
 
-        for attr in ["scheme", "path"]:
-            if getattr(url1_parsed, attr) != getattr(url2_parsed, attr):
-                return False
-        for attr in ["hostname"]:
-            if getattr(url1_parsed, attr).lower().rstrip('.') != getattr(url2_parsed, attr).lower().rstrip('.'):
-                return False
+        if URL_EXACT_MATCH(url1_parsed) != URL_EXACT_MATCH(url2_parsed):
+            return False
+        if url1_parsed.hostname.lower().rstrip('.') != url2_parsed.hostname.lower().rstrip('.'):
+            return False
 
         # Ports can be None if they are the default for the scheme
-        ports = [url1_parsed.port, url2_parsed.port]
-        comparisons = [url1_parsed, url2_parsed]
-        for index, url in enumerate(comparisons):
-            if url.port is None and url.scheme == "http":
-                ports[index] = 80
-            elif url.port is None and url.scheme == "https":
-                ports[index] = 443
-
-        if ports[0] != ports[1]:
-            return False
+        port1 = url1_parsed.port if url1_parsed.port is not None else DEFAULT_PORTS.get(url1_parsed.scheme)
+        port2 = url2_parsed.port if url2_parsed.port is not None else DEFAULT_PORTS.get(url2_parsed.scheme)
 
-        return True
+        return port1 == port2
 
     @staticmethod
     def sampled_list(resource_list):
@@ -189,17 +192,11 @@ class NMOSUtils(object):
         if not valid:
             return test.FAIL("Node API did not respond as expected: {}".format(devices))
 
-        found_type = False
-        found_api = False
         try:
-            for device in devices.json():
-                controls = device["controls"]
-                for control in controls:
-                    if control["type"] == type:
-                        found_type = True
-                        if NMOSUtils.compare_urls(href, control["href"]) and \
-                                authorization is control.get("authorization", False):
-                            found_api = True
+            controls = [control for device in devices.json() for control in device["controls"]
+                        if control["type"] == type]
+            found_api = any(NMOSUtils.compare_urls(href, control["href"]) and
+                            authorization is control.get("authorization", False) for control in controls)
         except json.JSONDecodeError:
             return test.FAIL("Non-JSON response returned from Node API")
         except KeyError:
@@ -207,7 +204,7 @@ class NMOSUtils(object):
 
         if found_api:
             return test.PASS()
-        elif found_type:
+        elif controls:
             return test.FAIL("Found one or more Device controls, but no href and authorization mode matched the "
                              "API under test")
         else:
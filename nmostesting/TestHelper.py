@@ -180,11 +180,15 @@ def is_ip_address(arg):
         return False
 
 
-def do_request(method, url, headers=None, **kwargs):
-    """Perform a basic HTTP request with appropriate error handling"""
+def do_request(method, url, headers=None, session=None, stream=False, **kwargs):
+    """
+    Perform a basic HTTP request with appropriate error handling.
+    An existing requests.Session may be supplied in order to re-use its pooled connections.
+    If stream is set, the response body is left unread so that it can be consumed incrementally.
+    """
     response = None
     try:
-        s = requests.Session()
+        s = session if session is not None else requests.Session()
 
         if not headers:
             headers = {}
@@ -199,7 +203,7 @@ def do_request(method, url, headers=None, **kwargs):
 
         req = requests.Request(method, url, headers={k: v for k, v in headers.items() if v is not None}, **kwargs)
         prepped = s.prepare_request(req)
-        settings = s.merge_environment_settings(prepped.url, {}, None, CONFIG.CERT_TRUST_ROOT_CA, None)
+        settings = s.merge_environment_settings(prepped.url, {}, stream, CONFIG.CERT_TRUST_ROOT_CA, None)
         response = s.send(prepped, timeout=CONFIG.HTTP_TIMEOUT, **settings)
         if prepped.url.startswith("https://"):
             if not response.url.startswith("https://"):
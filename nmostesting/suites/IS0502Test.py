@@ -15,20 +15,40 @@
 import time
 import uuid
 import re
+import requests
+import urllib3
+from http.cookiejar import DefaultCookiePolicy
+from requests.adapters import HTTPAdapter
 from requests.compat import json
 from copy import deepcopy
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from random import randint
 from jinja2 import Template
 
 from ..GenericTest import GenericTest, NMOSTestException
 from ..IS05Utils import IS05Utils
 from .. import Config as CONFIG
+from .. import TestHelper
 from ..TestHelper import compare_json, get_default_ip
 
+# ijson allows resource lists to be parsed as they are received, but isn't required
+try:
+    import ijson
+    JSON_DECODE_ERRORS = (json.JSONDecodeError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    JSON_DECODE_ERRORS = (json.JSONDecodeError,)
+
 NODE_API_KEY = "node"
 CONN_API_KEY = "connection"
 
+# Upper bound on the number of independent requests made to the APIs under test at once
+MAX_CONCURRENT_REQUESTS = 16
+# Activations each involve several requests and change device state, so fewer are made at once
+MAX_CONCURRENT_ACTIVATIONS = 8
+
 
 class IS0502Test(GenericTest):
     """
@@ -45,7 +65,66 @@ class IS0502Test(GenericTest):
         self.is05_resources = {"senders": [], "receivers": [], "_requested": [], "transport_types": {},
                                "transport_files": {}}
         self.is04_resources = {"senders": [], "receivers": [], "_requested": [], "sources": [], "flows": []}
-        self.is05_utils = IS05Utils(self.connection_url)
+        # IS-04 resources of each type indexed by ID, rebuilt whenever they are (re-)retrieved
+        self.is04_index = {}
+        # ETags returned alongside each IS-04 resource list, used to revalidate the cache on refresh
+        self.is04_etags = {}
+        # IS-04 Senders and Receivers filtered down to those using a transport supported by IS-05
+        self.is04_valid_resources = {}
+
+        # Share one pool of keep-alive connections between all requests to the Node and Connection APIs
+        # (including those made by IS05Utils). The pool retains up to pool_maxsize idle connections per host,
+        # enough for the largest set of worker threads, as the request and activation executors never overlap
+        self.session = requests.Session()
+        # Don't let cookies set by the APIs under test carry over between otherwise independent requests
+        self.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        pool_maxsize = max(MAX_CONCURRENT_REQUESTS, MAX_CONCURRENT_ACTIVATIONS)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.is05_utils = IS05Utils(self.connection_url, self.session)
+        self.valid_transports = frozenset(self.is05_utils.get_valid_transports(self.apis[CONN_API_KEY]["version"]))
+
+    def tear_down_tests(self):
+        self.session.close()
+
+    def do_request(self, method, url, **kwargs):
+        return TestHelper.do_request(method=method, url=url, session=self.session, **kwargs)
+
+    def parse_json(self, response):
+        """Decode a JSON response body, returning a success indicator alongside the decoded payload"""
+        try:
+            return True, response.json()
+        except json.JSONDecodeError:
+            return False, None
+
+    def parse_json_items(self, response, api_name):
+        """
+        Decode the elements of a streamed JSON array response from the named API, returning a success indicator
+        alongside either the list of elements or an error message. Any body which is not a JSON array is treated
+        as invalid. The elements are decoded incrementally as they are received when ijson is available.
+        """
+        non_json_message = "Non-JSON response returned from {}".format(api_name)
+        try:
+            if ijson is None:
+                items = response.json()
+                if not isinstance(items, list):
+                    return False, non_json_message
+                return True, items
+
+            response.raw.decode_content = True
+            events = ijson.parse(response.raw, use_float=True)
+            first_event = next(events, None)
+            if first_event != ("", "start_array", None):
+                return False, non_json_message
+            return True, list(ijson.items(chain([first_event], events), "item"))
+        except JSON_DECODE_ERRORS:
+            return False, non_json_message
+        except (urllib3.exceptions.HTTPError, requests.exceptions.RequestException) as e:
+            # The body is read after do_request has returned, so interrupted transfers must be handled here
+            return False, "{} did not respond as expected: {}".format(api_name, e)
+        finally:
+            response.close()
 
     def get_is04_resources(self, resource_type):
         """Retrieve all Senders or Receivers from a Node API, keeping hold of the returned objects"""
@@ -55,26 +134,63 @@ class IS0502Test(GenericTest):
         if resource_type in self.is04_resources["_requested"]:
             return True, ""
 
-        valid, resources = self.do_request("GET", self.node_url + resource_type)
+        valid, resources = self.do_request("GET", self.node_url + resource_type, stream=True)
         if not valid:
             return False, "Node API did not respond as expected: {}".format(resources)
 
-        try:
-            for resource in resources.json():
-                self.is04_resources[resource_type].append(resource)
-            self.is04_resources["_requested"].append(resource_type)
-        except json.JSONDecodeError:
-            return False, "Non-JSON response returned from Node API"
+        return self.store_is04_resources(resource_type, resources)
 
-        return True, ""
+    def store_is04_resources(self, resource_type, resources):
+        """Parse a Node API resource list response, keeping hold of the returned objects and its ETag"""
+        valid, resources_json = self.parse_json_items(resources, "Node API")
+        if not valid:
+            return False, resources_json
 
-    def refresh_is04_resources(self, resource_type):
-        """Force a re-retrieval of the IS-04 Senders or Receivers, bypassing the cache"""
-        if resource_type in self.is04_resources["_requested"]:
-            self.is04_resources["_requested"].remove(resource_type)
-            self.is04_resources[resource_type] = []
+        self.is04_resources[resource_type].extend(resources_json)
+        self.is04_index[resource_type] = {resource["id"]: resource for resource in self.is04_resources[resource_type]}
+        self.is04_valid_resources.pop(resource_type, None)
+        self.is04_etags[resource_type] = resources.headers.get("ETag")
+        self.is04_resources["_requested"].append(resource_type)
+
+        return True, ""
 
-        return self.get_is04_resources(resource_type)
+    def refresh_is04_resources(self, resource_type, revalidate=False):
+        """
+        Re-retrieve the IS-04 Senders or Receivers, bypassing the cache.
+        If revalidate is set, the cached objects are kept when the Node API reports via its ETag that nothing has
+        changed. This must not be used to observe the effect of an activation, as that would depend upon the
+        correctness of the Node's ETag handling rather than its current state.
+        """
+        if resource_type not in self.is04_resources["_requested"]:
+            return self.get_is04_resources(resource_type)
+
+        # Only an ETag is used to revalidate, as Last-Modified is too coarse to detect changes made by activations
+        resources = None
+        etag = self.is04_etags.get(resource_type)
+        if revalidate and etag:
+            valid, resources = self.do_request("GET", self.node_url + resource_type, headers={"If-None-Match": etag},
+                                               stream=True)
+            if not valid:
+                return False, "Node API did not respond as expected: {}".format(resources)
+            if resources.status_code == 304:
+                resources.close()
+                return True, ""
+
+        self.is04_resources["_requested"].remove(resource_type)
+        self.is04_resources[resource_type] = []
+        self.is04_index.pop(resource_type, None)
+        self.is04_etags.pop(resource_type, None)
+
+        if resources is None:
+            return self.get_is04_resources(resource_type)
+        return self.store_is04_resources(resource_type, resources)
+
+    def get_valid_is04_resources(self, resource_type):
+        """Return the retrieved IS-04 Senders or Receivers whose transport is valid for the Connection API"""
+        if resource_type not in self.is04_valid_resources:
+            self.is04_valid_resources[resource_type] = [resource for resource in self.is04_resources[resource_type]
+                                                        if resource["transport"] in self.valid_transports]
+        return self.is04_valid_resources[resource_type]
 
     def get_is05_resources(self, resource_type):
         """Retrieve all Senders or Receivers from a Connection API, keeping hold of the returned IDs"""
@@ -84,25 +200,28 @@ class IS0502Test(GenericTest):
         if resource_type in self.is05_resources["_requested"]:
             return True, ""
 
-        valid, resources = self.do_request("GET", self.connection_url + "single/" + resource_type)
+        valid, resources = self.do_request("GET", self.connection_url + "single/" + resource_type, stream=True)
         if not valid:
             return False, "Connection API did not respond as expected: {}".format(resources)
 
-        try:
-            for resource in resources.json():
-                resource_id = resource.rstrip("/")
-                self.is05_resources[resource_type].append(resource_id)
-                if self.is05_utils.compare_api_version(self.apis[CONN_API_KEY]["version"], "v1.1") >= 0:
-                    transport_type = self.is05_utils.get_transporttype(resource_id, resource_type.rstrip("s"))
-                    self.is05_resources["transport_types"][resource_id] = transport_type
-                else:
-                    self.is05_resources["transport_types"][resource_id] = "urn:x-nmos:transport:rtp"
-                if resource_type == "senders":
-                    transport_file = self.is05_utils.get_transportfile(resource_id)
-                    self.is05_resources["transport_files"][resource_id] = transport_file
-            self.is05_resources["_requested"].append(resource_type)
-        except json.JSONDecodeError:
-            return False, "Non-JSON response returned from Node API"
+        valid, resources_json = self.parse_json_items(resources, "Connection API")
+        if not valid:
+            return False, resources_json
+
+        port = resource_type.rstrip("s")
+        has_transporttype = self.is05_utils.compare_api_version(self.apis[CONN_API_KEY]["version"], "v1.1") >= 0
+        resource_ids = [resource.rstrip("/") for resource in resources_json]
+        for resource_id in resource_ids:
+            self.is05_resources[resource_type].append(resource_id)
+            if has_transporttype:
+                transport_type = self.is05_utils.get_transporttype(resource_id, port)
+                self.is05_resources["transport_types"][resource_id] = transport_type
+            else:
+                self.is05_resources["transport_types"][resource_id] = "urn:x-nmos:transport:rtp"
+            if resource_type == "senders":
+                transport_file = self.is05_utils.get_transportfile(resource_id)
+                self.is05_resources["transport_files"][resource_id] = transport_file
+        self.is05_resources["_requested"].append(resource_type)
 
         return True, ""
 
@@ -110,82 +229,80 @@ class IS0502Test(GenericTest):
         """Check that each Sender or Receiver found via IS-04 has a matching entry in IS-05"""
         assert resource_type in ["senders", "receivers"]
 
-        result = True
-        for is04_resource in self.is04_resources[resource_type]:
-            valid_transports = self.is05_utils.get_valid_transports(self.apis[CONN_API_KEY]["version"])
-            if is04_resource["transport"] in valid_transports:
-                if is04_resource["id"] not in self.is05_resources[resource_type]:
-                    result = False
-
-        return result
+        is05_ids = set(self.is05_resources[resource_type])
+        return all(is04_resource["id"] in is05_ids for is04_resource in self.get_valid_is04_resources(resource_type))
 
     def check_is05_in_is04(self, resource_type):
         """Check that each Sender or Receiver found via IS-05 has a matching entry in IS-04"""
         assert resource_type in ["senders", "receivers"]
 
-        result = True
-        for is05_resource in self.is05_resources[resource_type]:
-            is05_res_ok = False
-            for is04_resource in self.is04_resources[resource_type]:
-                if is04_resource["id"] == is05_resource:
-                    is05_res_ok = True
-                    break
-            result = is05_res_ok
-            if not result:
-                break
-
-        return result
+        is04_index = self.is04_index.get(resource_type, {})
+        return all(is05_resource in is04_index for is05_resource in self.is05_resources[resource_type])
 
     def activate_check_version(self, resource_type, resource_list):
+        port = resource_type.rstrip("s")
+        port_name = port.capitalize()
         try:
+            is04_index = self.is04_index.get(resource_type, {})
+            current_resources = {}
             for is05_resource in resource_list:
-                found_04_resource = False
-                for is04_resource in self.is04_resources[resource_type]:
-                    if is04_resource["id"] == is05_resource:
-                        found_04_resource = True
-                        current_ver = is04_resource["version"]
-                        transport_type = self.is05_resources["transport_types"][is05_resource]
-
-                        if resource_type == "receivers":
-                            # also check 'caps' version defined by BCP-004-01
-                            current_caps = is04_resource["caps"]
-                            current_caps_ver = current_caps["version"] if "version" in current_caps else None
-
-                        method = self.is05_utils.check_perform_immediate_activation
-                        valid, response = self.is05_utils.check_activation(resource_type.rstrip("s"), is05_resource,
-                                                                           method, transport_type)
-                        if not valid:
-                            return False, response
-
-                        time.sleep(CONFIG.API_PROCESSING_TIMEOUT)
-
-                        valid, response = self.do_request("GET", self.node_url + resource_type + "/" + is05_resource)
-                        if not valid:
-                            return False, "Node API did not respond as expected: {}".format(response)
-                        new_is04_resource = response.json()
-
-                        new_ver = new_is04_resource["version"]
-
-                        if self.is05_utils.compare_resource_version(new_ver, current_ver) != 1:
-                            return False, "IS-04 resource version did not change when {} {} was activated" \
-                                          .format(resource_type.rstrip("s").capitalize(), is05_resource)
-
-                        if resource_type == "receivers" and current_caps_ver:
-                            # the 'caps' version shouldn't change unless something else in 'caps' has changed
-                            # and that shouldn't happen as a result of the activation
-                            new_caps = new_is04_resource["caps"]
-                            new_caps_ver = new_caps["version"]
-                            if self.is05_utils.compare_resource_version(new_caps_ver, current_caps_ver) != 0:
-                                new_caps["version"] = current_caps_ver
-                                if compare_json(new_caps, current_caps):
-                                    return False, "IS-04 caps version changed when {} {} was activated" \
-                                                  .format(resource_type.rstrip("s").capitalize(), is05_resource)
-
-                if not found_04_resource:
+                is04_resource = is04_index.get(is05_resource)
+                if is04_resource is None:
                     return False, "Unable to find an IS-04 resource with ID {}".format(is05_resource)
 
-        except json.JSONDecodeError:
-            return False, "Non-JSON response returned from Node API"
+                current_caps = None
+                current_caps_ver = None
+                if resource_type == "receivers":
+                    # also check 'caps' version defined by BCP-004-01
+                    current_caps = is04_resource["caps"]
+                    current_caps_ver = current_caps["version"] if "version" in current_caps else None
+                current_resources[is05_resource] = (is04_resource["version"], current_caps, current_caps_ver)
+
+            # Activate every resource before waiting just once for the Node API to reflect the changes
+            method = self.is05_utils.check_perform_immediate_activation
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_ACTIVATIONS) as executor:
+                futures = [executor.submit(self.is05_utils.check_activation, port, is05_resource,
+                                           method, self.is05_resources["transport_types"][is05_resource])
+                           for is05_resource in resource_list]
+                for future in futures:
+                    valid, response = future.result()
+                    if not valid:
+                        for pending in futures:
+                            pending.cancel()
+                        return False, response
+
+            time.sleep(CONFIG.API_PROCESSING_TIMEOUT)
+
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+                futures = [executor.submit(self.do_request, "GET", self.node_url + resource_type + "/" + is05_resource)
+                           for is05_resource in resource_list]
+                for is05_resource, future in zip(resource_list, futures):
+                    current_ver, current_caps, current_caps_ver = current_resources[is05_resource]
+
+                    valid, response = future.result()
+                    if not valid:
+                        return False, "Node API did not respond as expected: {}".format(response)
+                    valid, new_is04_resource = self.parse_json(response)
+                    if not valid:
+                        return False, "Non-JSON response returned from Node API"
+
+                    new_ver = new_is04_resource["version"]
+
+                    if self.is05_utils.compare_resource_version(new_ver, current_ver) != 1:
+                        return False, "IS-04 resource version did not change when {} {} was activated" \
+                                      .format(port_name, is05_resource)
+
+                    if resource_type == "receivers" and current_caps_ver:
+                        # the 'caps' version shouldn't change unless something else in 'caps' has changed
+                        # and that shouldn't happen as a result of the activation
+                        new_caps = new_is04_resource["caps"]
+                        new_caps_ver = new_caps["version"]
+                        if self.is05_utils.compare_resource_version(new_caps_ver, current_caps_ver) != 0:
+                            new_caps["version"] = current_caps_ver
+                            if compare_json(new_caps, current_caps):
+                                return False, "IS-04 caps version changed when {} {} was activated" \
+                                              .format(port_name, is05_resource)
+
         except KeyError:
             return False, "Version attribute was not found in IS-04 resource"
 
@@ -203,31 +320,28 @@ class IS0502Test(GenericTest):
         if not valid:
             return False, result
 
+        # Only IS-04 v1.2+ has an 'active' subscription key
+        has_active = self.is05_utils.compare_api_version(self.apis[NODE_API_KEY]["version"], "v1.2") >= 0
+        id_key = "receiver_id" if resource_type == "senders" else "sender_id"
+        port_name = resource_type.rstrip("s").capitalize()
+
         try:
-            api = self.apis[NODE_API_KEY]
+            is04_index = self.is04_index.get(resource_type, {})
             for is05_resource in resource_list:
-                found_04_resource = False
-                for is04_resource in self.is04_resources[resource_type]:
-                    if is04_resource["id"] == is05_resource:
-                        found_04_resource = True
-                        subscription = is04_resource["subscription"]
-
-                        # Only IS-04 v1.2+ has an 'active' subscription key
-                        if self.is05_utils.compare_api_version(api["version"], "v1.2") >= 0:
-                            if subscription["active"] is not False:
-                                return False, "IS-04 {} {} was not marked as inactive when IS-05 master_enable set to" \
-                                              " false".format(resource_type.rstrip("s").capitalize(), is05_resource)
-
-                        id_key = "sender_id"
-                        if resource_type == "senders":
-                            id_key = "receiver_id"
-                        if subscription[id_key] is not None:
-                            return False, "IS-04 {} {} still indicates a subscribed '{}' when parked".format(
-                                          resource_type.rstrip("s").capitalize(), is05_resource, id_key)
-
-                if not found_04_resource:
+                is04_resource = is04_index.get(is05_resource)
+                if is04_resource is None:
                     return False, "Unable to find an IS-04 resource with ID {}".format(is05_resource)
 
+                subscription = is04_resource["subscription"]
+
+                if has_active and subscription["active"] is not False:
+                    return False, "IS-04 {} {} was not marked as inactive when IS-05 master_enable set to" \
+                                  " false".format(port_name, is05_resource)
+
+                if subscription[id_key] is not None:
+                    return False, "IS-04 {} {} still indicates a subscribed '{}' when parked".format(
+                                  port_name, is05_resource, id_key)
+
         except KeyError:
             return False, "Subscription attribute was not found in IS-04 resource"
 
@@ -255,40 +369,43 @@ class IS0502Test(GenericTest):
         if not valid:
             return False, result
 
+        # Only IS-04 v1.2+ has an 'active' subscription key
+        has_active = self.is05_utils.compare_api_version(self.apis[NODE_API_KEY]["version"], "v1.2") >= 0
+        id_key = "receiver_id" if resource_type == "senders" else "sender_id"
+        port_name = resource_type.rstrip("s").capitalize()
+
         try:
-            api = self.apis[NODE_API_KEY]
+            is04_index = self.is04_index.get(resource_type, {})
             for is05_resource in resource_list:
                 if self.is05_resources["transport_types"][is05_resource] != "urn:x-nmos:transport:rtp":
                     continue
 
-                found_04_resource = False
-                for is04_resource in self.is04_resources[resource_type]:
-                    if is04_resource["id"] == is05_resource:
-                        found_04_resource = True
-                        subscription = is04_resource["subscription"]
-
-                        # Only IS-04 v1.2+ has an 'active' subscription key
-                        if self.is05_utils.compare_api_version(api["version"], "v1.2") >= 0:
-                            if subscription["active"] is not True:
-                                return False, "IS-04 {} {} was not marked as active when IS-05 master_enable set to" \
-                                              " true".format(resource_type.rstrip("s").capitalize(), is05_resource)
-
-                        id_key = "sender_id"
-                        if resource_type == "senders":
-                            id_key = "receiver_id"
-                        if subscription[id_key] != sub_ids[is05_resource]:
-                            return False, "IS-04 {} {} indicates subscription to '{}' rather than '{}'".format(
-                                          resource_type.rstrip("s").capitalize(), is05_resource, subscription[id_key],
-                                          sub_ids[is05_resource])
-
-                if not found_04_resource:
+                is04_resource = is04_index.get(is05_resource)
+                if is04_resource is None:
                     return False, "Unable to find an IS-04 resource with ID {}".format(is05_resource)
 
+                subscription = is04_resource["subscription"]
+
+                if has_active and subscription["active"] is not True:
+                    return False, "IS-04 {} {} was not marked as active when IS-05 master_enable set to" \
+                                  " true".format(port_name, is05_resource)
+
+                if subscription[id_key] != sub_ids[is05_resource]:
+                    return False, "IS-04 {} {} indicates subscription to '{}' rather than '{}'".format(
+                                  port_name, is05_resource, subscription[id_key], sub_ids[is05_resource])
+
         except KeyError:
             return False, "Subscription attribute was not found in IS-04 resource"
 
         return True, ""
 
+    def get_transport_file(self, url):
+        """Retrieve the contents of a transport file, or None if it could not be accessed"""
+        valid, result = self.do_request("GET", url)
+        if valid and result.status_code != 404:
+            return result.text
+        return None
+
     def test_01(self, test):
         """Check that version 1.2 or greater of the Node API is available"""
 
@@ -355,7 +472,7 @@ class IS0502Test(GenericTest):
 
         resource_type = "receivers"
 
-        valid, result = self.refresh_is04_resources(resource_type)
+        valid, result = self.refresh_is04_resources(resource_type, revalidate=True)
         if not valid:
             return test.FAIL(result)
         valid, result = self.get_is05_resources(resource_type)
@@ -379,7 +496,7 @@ class IS0502Test(GenericTest):
 
         resource_type = "senders"
 
-        valid, result = self.refresh_is04_resources(resource_type)
+        valid, result = self.refresh_is04_resources(resource_type, revalidate=True)
         if not valid:
             return test.FAIL(result)
         valid, result = self.get_is05_resources(resource_type)
@@ -545,26 +662,32 @@ class IS0502Test(GenericTest):
                 return test.FAIL(result)
 
         try:
+            bindings = []
             for resource_type in ["senders", "receivers"]:
-                for resource in self.is04_resources[resource_type]:
-                    valid_transports = self.is05_utils.get_valid_transports(self.apis[CONN_API_KEY]["version"])
-                    if resource["transport"] not in valid_transports:
-                        continue
+                for resource in self.get_valid_is04_resources(resource_type):
+                    bindings.append((resource_type, resource["id"], len(resource["interface_bindings"])))
+
+            # The /active requests are independent, so issue them concurrently and check the results in order
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+                futures = [executor.submit(self.do_request, "GET", self.connection_url + "single/" + resource_type +
+                                           "/" + resource_id + "/active")
+                           for resource_type, resource_id, _ in bindings]
 
-                    bindings_length = len(resource["interface_bindings"])
-                    url_path = self.connection_url + "single/" + resource_type + "/" + resource["id"] + "/active"
-                    valid, result = self.do_request("GET", url_path)
+                for (resource_type, resource_id, bindings_length), future in zip(bindings, futures):
+                    valid, result = future.result()
                     if not valid:
                         return test.FAIL("Connection API returned unexpected result "
-                                         "for {} '{}'".format(resource_type.rstrip("s").capitalize(), resource["id"]))
+                                         "for {} '{}'".format(resource_type.rstrip("s").capitalize(), resource_id))
 
-                    trans_params_length = len(result.json()["transport_params"])
+                    valid, active = self.parse_json(result)
+                    if not valid:
+                        return test.FAIL("Non-JSON response returned from Connection API")
+
+                    trans_params_length = len(active["transport_params"])
                     if trans_params_length != bindings_length:
                         return test.FAIL("Array length mismatch "
-                                         "for {} '{}'".format(resource_type.rstrip("s").capitalize(), resource["id"]))
+                                         "for {} '{}'".format(resource_type.rstrip("s").capitalize(), resource_id))
 
-        except json.JSONDecodeError:
-            return test.FAIL("Non-JSON response returned from Connection API")
         except KeyError as ex:
             return test.FAIL("Expected attribute not found in IS-04 Sender/Receiver "
                              "or IS-05 active resource: {}".format(ex))
@@ -579,24 +702,26 @@ class IS0502Test(GenericTest):
             return test.FAIL(result)
 
         try:
-            valid_transports = self.is05_utils.get_valid_transports(self.apis[CONN_API_KEY]["version"])
-
             access_error = False
 
-            for sender in self.is04_resources["senders"]:
-                if sender["transport"] not in valid_transports:
-                    continue
+            senders = self.get_valid_is04_resources("senders")
+
+            # Both transport files for every Sender are fetched concurrently before any comparisons are made
+            futures = {}
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+                for sender in senders:
+                    is04_future = None
+                    if sender["manifest_href"] is not None and sender["manifest_href"] != "":
+                        is04_future = executor.submit(self.get_transport_file, sender["manifest_href"])
+                    url_path = self.connection_url + "single/senders/" + sender["id"] + "/transportfile"
+                    is05_future = executor.submit(self.get_transport_file, url_path)
+                    futures[sender["id"]] = (is04_future, is05_future)
+
+            transport_files = {sender_id: (is04_future.result() if is04_future else None, is05_future.result())
+                               for sender_id, (is04_future, is05_future) in futures.items()}
 
-                is04_transport_file = None
-                is05_transport_file = None
-                if sender["manifest_href"] is not None and sender["manifest_href"] != "":
-                    valid, result = self.do_request("GET", sender["manifest_href"])
-                    if valid and result.status_code != 404:
-                        is04_transport_file = result.text
-                url_path = self.connection_url + "single/senders/" + sender["id"] + "/transportfile"
-                valid, result = self.do_request("GET", url_path)
-                if valid and result.status_code != 404:
-                    is05_transport_file = result.text
+            for sender in senders:
+                is04_transport_file, is05_transport_file = transport_files[sender["id"]]
 
                 if is04_transport_file != is05_transport_file:
                     if is04_transport_file is None:
@@ -982,9 +1107,8 @@ class IS0502Test(GenericTest):
         if not valid:
             return test.FAIL("Node API did not respond as expected: {}".format(resource))
 
-        try:
-            node_self = resource.json()
-        except json.JSONDecodeError:
+        valid, node_self = self.parse_json(resource)
+        if not valid:
             return test.FAIL("Non-JSON response returned from Node API")
 
         clock_map = {clock["name"]: clock for clock in node_self["clocks"]}